@@ -23,11 +23,22 @@
 __all__ = ("script_driver", "__version__", "__version_tuple__")
 
 
-# A few convenience imports
-from reprepbuild.scripts.python_script import script_driver
-
 try:
     from ._version import __version__, __version_tuple__
 except ImportError:
     __version__ = "0.0.0a-dev"
     __version_tuple__ = (0, 0, 0, "a-dev")
+
+
+def __getattr__(name):
+    """Import ``script_driver`` on first use.
+
+    This convenience import is only needed by Python scripts,
+    and would otherwise slow down the startup of all other entry points.
+    """
+    if name == "script_driver":
+        # Lazy import, only done when script_driver is accessed.
+        from .scripts.python_script import script_driver
+
+        return script_driver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
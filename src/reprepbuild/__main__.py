@@ -29,9 +29,11 @@ This is by design, to have only one (reproducible) way to build a publication
 from the source, for which all the settings and details are stored in files.
 """
 
+import io
 import os
 import subprocess
 import sys
+from typing import TextIO
 
 from ninja import Writer
 from tqdm import tqdm
@@ -43,12 +45,39 @@ __all__ = ("main", "generate")
 
 
 DEFAULT_RULES = {"error": {"command": "echo '${message}'; exit -1"}}
+NINJA_STATUS = "\033[1;36;40m[%f/%t]\033[0;0m "
+
+
+class _Writer(Writer):
+    """Ninja Writer with a faster output of short comments.
+
+    Most comments are short single-line strings, for which ``textwrap.wrap`` in
+    ``Writer.comment`` is comparatively expensive and has no effect.
+    Build statements are still written with ``Writer.build``, which takes care of
+    escaping and line continuations.
+    """
+
+    def comment(self, text: str):
+        if (
+            0 < len(text) <= self.width - 2
+            and text.isprintable()
+            and text[0] != " "
+            and text[-1] != " "
+        ):
+            self.output.write("# " + text + "\n")
+        else:
+            super().comment(text)
 
 
 def generate():
-    """Parse ``reprebuild.yaml`` files and write a ``build.ninja`` file."""
+    """Parse ``reprebuild.yaml`` files and write a ``build.ninja`` file.
+
+    When an identical ``build.ninja`` already exists, it is not rewritten.
+    Its modification time is only updated with ``os.utime``.
+    """
     # Set env var defaults when not specified and switch to root
-    root = os.environ.get("REPREPBUILD_ROOT", os.getcwd())
+    cwd = os.getcwd()
+    root = os.environ.get("REPREPBUILD_ROOT", cwd)
     path_config = os.path.join(root, "reprepbuild.yaml")
     if not os.path.exists(path_config):
         print(f"No reprepbuild.yaml in {root}")
@@ -60,96 +89,123 @@ def generate():
         path_default_constants = os.path.join(root, "constants.json")
         if os.path.isfile(path_default_constants):
             paths_constants.append(path_default_constants)
-    if root != os.getcwd():
+    if root != cwd:
         print(f"Changing to {root}")
         os.chdir(root)
 
     # Parse the reprepbuild.yaml files (recursively)
     generators = []
-    load_config(root, path_config, paths_constants, generators)
+    paths_config = []
+    load_config(root, path_config, paths_constants, generators, paths_config=paths_config)
 
+    # Write to an in-memory buffer first, such that an error in one of the generators
+    # never leaves an incomplete build.ninja behind.
+    # The existing file is only replaced when its contents have changed.
+    buffer = io.StringIO()
+    _write_ninja(buffer, generators, paths_config + paths_constants)
+    contents = buffer.getvalue()
+    if os.path.isfile("build.ninja"):
+        with open("build.ninja") as fh:
+            unchanged = fh.read() == contents
+        if unchanged:
+            # Mark the file as up to date with respect to the files read while generating it.
+            os.utime("build.ninja")
+            return
+    path_tmp = ".build.ninja.tmp"
+    with open(path_tmp, "w") as fh:
+        fh.write(contents)
+    os.replace(path_tmp, "build.ninja")
+
+
+def _write_ninja(fh: TextIO, generators: list[BaseGenerator], paths_gendeps: list[str]):
+    """Write pools, rules and builds for all generators to a text stream.
+
+    The paths_gendeps are files that influence the build.ninja file,
+    in addition to those reported by the generators.
+    """
     # Loop over all files and create pools, rules and builds for them.
-    with open("build.ninja", "w") as fh:
-        writer = Writer(fh, 100)
-
-        # Write pools
-        pools = _collect_dicts(generators, "pools")
-        writer.comment("All pools")
-        for pool_name, pool in pools.items():
-            writer.pool(name=pool_name, **pool)
-        writer.newline()
+    writer = _Writer(fh, 100)
 
-        # Write all rules, even if some are not used.
-        rules = _collect_dicts(generators, "rules")
-        rules.update(DEFAULT_RULES)
-        writer.comment("All rules (except for the generator)")
-        for rule_name, rule in rules.items():
-            rule["command"] = "${_pre_command}" + rule["command"]
-            writer.rule(name=rule_name, **rule)
-        writer.newline()
+    # Write pools
+    pools, rules = _collect_pools_rules(generators)
+    writer.comment("All pools")
+    for pool_name, pool in pools.items():
+        writer.pool(name=pool_name, **pool)
+    writer.newline()
 
-        # Write all build lines with comments and defaults
-        outputs = set()
-        defaults = set()
-        gendeps = set(paths_constants)
-        tqdm_iterator = tqdm(generators, "Generator")
-        for generator in tqdm_iterator:
-            if _test_filter_command(writer, generator):
-                continue
-            for records, new_gendeps in generator(outputs, defaults):
-                gendeps.update(new_gendeps)
-                for record in records:
-                    if isinstance(record, str):
-                        writer.comment(record)
-                        if record.startswith("inp:"):
-                            tqdm_iterator.set_description(f"Generator {_truncate(record[5:])}")
-                    elif isinstance(record, list):
-                        for default in record:
-                            if default not in defaults:
-                                writer.default(record)
-                                defaults.update(record)
-                    elif isinstance(record, dict):
-                        new_outputs = set(record["outputs"])
-                        new_outputs |= set(record.get("implicit_outputs", []))
-                        if outputs.isdisjoint(new_outputs):
-                            writer.build(**record)
-                            outputs.update(new_outputs)
-                        else:
-                            # Some outputs are repeated, in which case no new build lines are
-                            # written. It is assumed that the preceding builds are more specific
-                            # and therefore should take priority over later ones.
-                            # To maintain sanity, ambiguous cases are not allowed, i.e. all
-                            # new outputs should already exist.
-                            if not new_outputs.issubset(outputs):
-                                raise ValueError(
-                                    "Outputs are partially generated in previous builds. "
-                                    f"New: {new_outputs - outputs} "
-                                    f"Existing: {new_outputs & outputs}"
-                                )
-                            writer.comment("Skipping due to overlap with previous builds.")
-                    else:
-                        raise TypeError(f"Cannot process build record {record}")
-                writer.newline()
+    # Write all rules, even if some are not used.
+    rules.update(DEFAULT_RULES)
+    writer.comment("All rules (except for the generator)")
+    for rule_name, rule in rules.items():
+        # Make a new dict, to avoid modifying DEFAULT_RULES or the rules of a command.
+        rule = rule | {"command": "${_pre_command}" + rule["command"]}
+        writer.rule(name=rule_name, **rule)
+    writer.newline()
 
-        # Insert generator if some files could not be scanned
-        if len(gendeps) > 0:
+    # Write all build lines with comments and defaults
+    outputs = set()
+    defaults = set()
+    gendeps = set(paths_gendeps)
+    command_filter = os.environ.get("REPREPBUILD_FILTER_COMMAND")
+    tqdm_iterator = tqdm(generators, "Generator", mininterval=0.5)
+    for generator in tqdm_iterator:
+        if command_filter is not None and _test_filter_command(writer, generator, command_filter):
+            continue
+        for records, new_gendeps in generator(outputs, defaults):
+            gendeps.update(new_gendeps)
+            for record in records:
+                if isinstance(record, str):
+                    writer.comment(record)
+                    if record.startswith("inp:"):
+                        # Without refresh, the description is shown at the next (throttled)
+                        # update of the progress bar, instead of writing to the terminal.
+                        tqdm_iterator.set_description(
+                            f"Generator {_truncate(record[5:])}", refresh=False
+                        )
+                elif isinstance(record, list):
+                    new_defaults = [default for default in record if default not in defaults]
+                    if len(new_defaults) > 0:
+                        writer.default(new_defaults)
+                        defaults.update(new_defaults)
+                elif isinstance(record, dict):
+                    new_outputs = {*record["outputs"], *record.get("implicit_outputs", ())}
+                    overlap = outputs & new_outputs
+                    if len(overlap) == 0:
+                        writer.build(**record)
+                        outputs.update(new_outputs)
+                    else:
+                        # Some outputs are repeated, in which case no new build lines are
+                        # written. It is assumed that the preceding builds are more specific
+                        # and therefore should take priority over later ones.
+                        # To maintain sanity, ambiguous cases are not allowed, i.e. all
+                        # new outputs should already exist.
+                        if len(overlap) != len(new_outputs):
+                            raise ValueError(
+                                "Outputs are partially generated in previous builds. "
+                                f"New: {new_outputs - outputs} "
+                                f"Existing: {overlap}"
+                            )
+                        writer.comment("Skipping due to overlap with previous builds.")
+                else:
+                    raise TypeError(f"Cannot process build record {record}")
             writer.newline()
-            writer.comment("Some files influence the generation of the build files.")
-            writer.comment("When they change, the build.ninja file must be regenerated.")
-            writer.rule("generator", command="rr-generator", generator=True)
-            writer.build(
-                rule="generator", implicit=sorted(gendeps), outputs="build.ninja", pool="console"
-            )
+
+    # Insert generator if some files could not be scanned
+    if len(gendeps) > 0:
+        writer.newline()
+        writer.comment("Some files influence the generation of the build files.")
+        writer.comment("When they change, the build.ninja file must be regenerated.")
+        writer.rule("generator", command="rr-generator", generator=True)
+        writer.build(
+            rule="generator", implicit=sorted(gendeps), outputs="build.ninja", pool="console"
+        )
 
 
-def _test_filter_command(writer: Writer, generator: BaseGenerator):
-    """Return true if command_name equals REPREPBUILD_FILTER_COMMAND environment variable."""
-    if "REPREPBUILD_FILTER_COMMAND" not in os.environ:
-        return False
+def _test_filter_command(writer: Writer, generator: BaseGenerator, command_filter: str):
+    """Return true if the generator's command differs from REPREPBUILD_FILTER_COMMAND."""
     if not isinstance(generator, BuildGenerator):
         return False
     command_name = generator.command.name
-    command_filter = os.environ["REPREPBUILD_FILTER_COMMAND"]
     if command_filter != command_name:
         writer.comment(
             f"Skipping records: Command {command_name} differs from "
@@ -164,18 +220,28 @@ def _truncate(s):
     return ("..." if len(s) > 20 else "") + s[-20:]
 
 
-def _collect_dicts(generators: list[BaseGenerator], attr_name: str) -> dict[str:object]:
-    """Combine dictionaries, used for pools and rules."""
-    result = {}
+def _collect_pools_rules(generators: list[BaseGenerator]) -> tuple[dict, dict]:
+    """Combine the pools and rules of all commands in a single pass over the generators."""
+    pools = {}
+    rules = {}
+    # Many generators share the same command, whose pools and rules need to be merged only once.
+    seen = set()
     for generator in generators:
-        if isinstance(generator, BuildGenerator):
-            for name, kwargs in getattr(generator.command, attr_name).items():
-                if name in result:
-                    if result[name] != kwargs:
-                        raise ValueError(f"Same name but different {attr_name}: {name}")
-                else:
-                    result[name] = kwargs
-    return result
+        if isinstance(generator, BuildGenerator) and id(generator.command) not in seen:
+            seen.add(id(generator.command))
+            _merge_dicts(pools, generator.command.pools, "pools")
+            _merge_dicts(rules, generator.command.rules, "rules")
+    return pools, rules
+
+
+def _merge_dicts(result: dict[str, object], other: dict[str, object], attr_name: str):
+    """Add items from other to result, checking for inconsistent duplicates."""
+    for name, kwargs in other.items():
+        if name in result:
+            if result[name] != kwargs:
+                raise ValueError(f"Same name but different {attr_name}: {name}")
+        else:
+            result[name] = kwargs
 
 
 def parse_args():
@@ -195,11 +261,11 @@ def main():
     # before rebuilding, so it does not start by rerunning the generator.
     generate()
     subprocess.run(["ninja", "-t", "restat", "build.ninja"], check=False)
-    subprocess.run(
-        ["ninja", *args],
-        check=False,
-        env=os.environ | {"NINJA_STATUS": "\033[1;36;40m[%f/%t]\033[0;0m "},
-    )
+    # Replace the current process by ninja, which also passes on its exit code.
+    os.environ["NINJA_STATUS"] = NINJA_STATUS
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp("ninja", ["ninja", *args])
 
 
 if __name__ == "__main__":
@@ -36,25 +36,28 @@ from .zip import zip_latex, zip_manifest, zip_plain
 __all__ = ("get_commands",)
 
 
+COMMANDS = (
+    check_hrefs,
+    latex,
+    latex_flat,
+    latex_diff,
+    pdf_add_notes,
+    pdf_merge,
+    pdf_nup,
+    python_script,
+    convert_odf_pdf,
+    convert_svg_pdf,
+    convert_pdf_png,
+    copy,
+    markdown_pdf,
+    pdf_raster,
+    render,
+    shell_script,
+    zip_latex,
+    zip_manifest,
+    zip_plain,
+)
+
+
 def get_commands():
-    return [
-        check_hrefs,
-        latex,
-        latex_flat,
-        latex_diff,
-        pdf_add_notes,
-        pdf_merge,
-        pdf_nup,
-        python_script,
-        convert_odf_pdf,
-        convert_svg_pdf,
-        convert_pdf_png,
-        copy,
-        markdown_pdf,
-        pdf_raster,
-        render,
-        shell_script,
-        zip_latex,
-        zip_manifest,
-        zip_plain,
-    ]
+    return COMMANDS
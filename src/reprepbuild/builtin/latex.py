@@ -46,22 +46,54 @@ There are a few caveats:
   fail to get the dependencies right. Just don't do that.
 """
 
+import functools
 import os
 import re
+import stat
+import types
 
 import attrs
 
 from ..command import Command
+from ..utils import join_normalized
 
 __all__ = ("scan_latex_deps", "latex", "latex_flat", "latex_diff")
 
 
-RE_OPTIONS = re.MULTILINE | re.DOTALL
-RE_INPUT = re.compile(r"\\input\s*\{(.*?)}", RE_OPTIONS)
-RE_VERBATIMINPUT = re.compile(r"\\verbatiminput\s*\{(.*?)}", RE_OPTIONS)
-RE_INCLUDEGRAPHICS = re.compile(r"\\includegraphics(?:\s*\[.*?])?\s*\{(.*?)}", RE_OPTIONS)
-RE_BIBLIOGRAPHY = re.compile(r"\\bibliography\s*\{(.*?)}", RE_OPTIONS)
-RE_IMPORT = re.compile(r"\\import\s*\{(.*?)}\s*\{(.*?)}", RE_OPTIONS)
+# All references are matched with a single regular expression, such that the TeX source
+# is scanned only once. The name of the last matching group identifies the command.
+# TeX sources are scanned as bytes, such that only the matched file names need decoding.
+# Arguments are matched with negated character classes, which can also span multiple lines
+# and do not need to backtrack, unlike a lazy .*? with re.DOTALL.
+RE_REFERENCE = re.compile(
+    rb"\\(?:"
+    rb"input\s*\{(?P<input>[^}]*)}"
+    rb"|verbatiminput\s*\{(?P<verbatiminput>[^}]*)}"
+    rb"|includegraphics(?:\s*\[[^\]]*])?\s*\{(?P<includegraphics>[^}]*)}"
+    rb"|bibliography\s*\{(?P<bibliography>[^}]*)}"
+    rb"|import\s*\{(?P<import_root>[^}]*)}\s*\{(?P<import>[^}]*)}"
+    rb")"
+)
+# Default extensions for each command, added when a reference has no extension.
+REFERENCE_EXTENSIONS = {
+    "input": ".tex",
+    "verbatiminput": ".txt",
+    "includegraphics": ".pdf",
+    "bibliography": ".bib",
+    "import": ".tex",
+}
+
+RE_WHITESPACE = re.compile(r"\s+")
+# Translation table to remove braces from paths.
+DELETE_BRACES = str.maketrans("", "", "{}")
+# Lines with "%REPREPBUILD ignore" are not scanned for references.
+RE_IGNORE = re.compile(rb"^.*%REPREPBUILD ignore.*$", re.MULTILINE)
+# Lines starting with "%REPREPBUILD input" specify additional implicit dependencies.
+RE_DIRECTIVE_INPUT = re.compile(rb"^%REPREPBUILD input (.*)$", re.MULTILINE)
+# Comments start with a percent sign, unless it is escaped.
+# An even number of preceding backslashes (e.g. a line break \\) does not escape it.
+# These backslashes are captured, such that they can be kept in the substitution.
+RE_COMMENT = re.compile(rb"(?<!\\)((?:\\\\)*)%.*")
 
 
 def cleanup_path(path, ext=None):
@@ -79,10 +111,10 @@ def cleanup_path(path, ext=None):
     path_clean
         A cleaned up file name, including the path of the dirname.
     """
-    path = path.replace("{", "")
-    path = path.replace("}", "")
-    path = re.sub(r"\s+", " ", path)
-    path = path.strip()
+    path = path.translate(DELETE_BRACES).strip()
+    # Most paths contain no whitespace, in which case the regular expression can be skipped.
+    if not path.isprintable() or " " in path:
+        path = RE_WHITESPACE.sub(" ", path)
     if "." not in os.path.basename(path) and ext is not None:
         path += ext
     path = os.path.normpath(path)
@@ -95,7 +127,7 @@ def iter_latex_references(tex_no_comments):
     Parameters
     ----------
     tex_no_comments
-        The contents of a TeX source files from which comments were stripped.
+        The contents of a TeX source files from which comments were stripped, as bytes.
 
     Yields
     ------
@@ -109,16 +141,10 @@ def iter_latex_references(tex_no_comments):
         (Approximate guess, because the correct extension for figures
         depends on details of the LaTeX compiler.)
     """
-    for fn_inc in re.findall(RE_INPUT, tex_no_comments):
-        yield ".", fn_inc, ".tex"
-    for fn_inc in re.findall(RE_VERBATIMINPUT, tex_no_comments):
-        yield ".", fn_inc, ".txt"
-    for fn_inc in re.findall(RE_INCLUDEGRAPHICS, tex_no_comments):
-        yield ".", fn_inc, ".pdf"
-    for fn_inc in re.findall(RE_BIBLIOGRAPHY, tex_no_comments):
-        yield ".", fn_inc, ".bib"
-    for new_root, fn_inc in re.findall(RE_IMPORT, tex_no_comments):
-        yield new_root, fn_inc, ".tex"
+    for match in RE_REFERENCE.finditer(tex_no_comments):
+        command = match.lastgroup
+        new_root = os.fsdecode(match.group("import_root")) if command == "import" else "."
+        yield new_root, os.fsdecode(match.group(command)), REFERENCE_EXTENSIONS[command]
 
 
 def scan_latex_deps(path_tex, tex_root=None):
@@ -141,38 +167,104 @@ def scan_latex_deps(path_tex, tex_root=None):
         BibTeX files.
     """
     implicit = set()
-    gendeps = {path_tex}
+    gendeps = set()
     bib = set()
-
-    if os.path.isfile(path_tex):
-        if tex_root is None:
-            tex_root = os.path.normpath(os.path.dirname(path_tex))
-        with open(path_tex) as fh:
-            stripped = []
-            for line in fh:
-                if "%REPREPBUILD ignore" in line:
-                    pass
-                elif line.startswith("%REPREPBUILD input "):
-                    implicit.add(os.path.normpath(os.path.join(tex_root, line[18:].strip())))
-                else:
-                    stripped.append(line[: line.find("%")].rstrip())
-
-            # Process the file references
-            for new_root, fn_inc, ext in iter_latex_references("\n".join(stripped)):
-                new_root = os.path.normpath(os.path.join(tex_root, cleanup_path(new_root)))
-                path_inc = os.path.normpath(os.path.join(new_root, cleanup_path(fn_inc, ext)))
-                if ext == ".bib":
-                    bib.add(path_inc)
-                else:
-                    implicit.add(path_inc)
-                if ext == ".tex":
-                    sub_implicit, sub_gendeps, sub_bib = scan_latex_deps(path_inc, new_root)
-                    implicit.update(sub_implicit)
-                    gendeps.update(sub_gendeps)
-                    bib.update(sub_bib)
+    if tex_root is None:
+        tex_root = os.path.normpath(os.path.dirname(path_tex))
+    # Included files are processed with a worklist instead of recursion.
+    # Pairs (path_tex, tex_root) are processed only once, such that shared files
+    # are scanned once and circular inclusions do not result in an endless loop.
+    todo = [(path_tex, tex_root)]
+    seen = set(todo)
+    while len(todo) > 0:
+        path_tex, tex_root = todo.pop()
+        gendeps.add(path_tex)
+        scanned = _scan_latex_file(path_tex, tex_root)
+        if scanned is not None:
+            file_implicit, file_bib, file_children = scanned
+            implicit.update(file_implicit)
+            bib.update(file_bib)
+            for child in file_children:
+                if child not in seen:
+                    seen.add(child)
+                    todo.append(child)
     return sorted(implicit), sorted(gendeps), sorted(bib)
 
 
+def _scan_latex_file(path_tex, tex_root):
+    """Scan a single LaTeX file for dependencies, without recursion.
+
+    Parameters
+    ----------
+    path_tex
+        The path to the LaTeX source to scan.
+    tex_root
+        The directory with respect to which the latex file references should be interpreted.
+
+    Returns
+    -------
+    scanned
+        None if path_tex is not a file.
+        Otherwise, a tuple with implicit dependencies, BibTeX files and included TeX files.
+        The latter are pairs of the included TeX file and its tex_root.
+    """
+    try:
+        st = os.stat(path_tex)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _scan_latex_file_cached(
+        os.path.abspath(path_tex), os.path.normpath(tex_root), st.st_mtime_ns, st.st_size
+    )
+
+
+# The results of _scan_latex_file_cached are reused as long as the modification time
+# and size of the TeX file do not change. This avoids rescanning files that are included
+# by multiple documents, or that are scanned again by rrr after a change elsewhere.
+# The cache is bounded for long-running rrr sessions.
+# Limitation: an edit that keeps the file size and that lands within the timestamp
+# granularity of the file system after the previous scan is not detected.
+@functools.lru_cache(maxsize=1024)
+def _scan_latex_file_cached(path_tex, tex_root, mtime_ns, size):
+    """Scan a single LaTeX file, given its absolute path and its normalized tex_root.
+
+    The arguments mtime_ns and size are only used as part of the cache key.
+    See _scan_latex_file for the other arguments and the return value.
+    """
+    with open(path_tex, "rb") as fh:
+        tex = fh.read()
+    if b"%REPREPBUILD ignore" in tex:
+        tex = RE_IGNORE.sub(b"", tex)
+    implicit = []
+    if b"%REPREPBUILD input " in tex:
+        for fn_inc in RE_DIRECTIVE_INPUT.findall(tex):
+            fn_inc = os.fsdecode(fn_inc.strip())
+            implicit.append(os.path.normpath(os.path.join(tex_root, fn_inc)))
+    # Cheap membership tests avoid regular expressions that cannot match.
+    if b"%" in tex:
+        tex = RE_COMMENT.sub(rb"\1", tex)
+    references = iter_latex_references(tex) if b"\\" in tex else ()
+
+    # Process the file references
+    bib = []
+    children = []
+    for new_root, fn_inc, ext in references:
+        if new_root != ".":
+            new_root = join_normalized(tex_root, cleanup_path(new_root))
+        else:
+            new_root = tex_root
+        path_inc = join_normalized(new_root, cleanup_path(fn_inc, ext))
+        if ext == ".bib":
+            bib.append(path_inc)
+        else:
+            implicit.append(path_inc)
+        if ext == ".tex":
+            children.append((path_inc, new_root))
+
+    return tuple(implicit), tuple(bib), tuple(children)
+
+
 @attrs.define
 class Latex(Command):
     """Compile LaTeX document sufficient number of times."""
@@ -306,6 +398,14 @@ DEFAULT_CONTEXT2CMD = (
     "abstract,supplementary,dataavailability,funding,"
     "authorcontributions,conflictsofinterest,abbreviations"
 )
+# Default variables of the latex_diff builds, shared by all of them.
+# The read-only proxy ensures that no build can modify the variables of the others.
+LATEX_DIFF_VARIABLES = types.MappingProxyType(
+    {
+        "latexdiff_context2cmd": DEFAULT_CONTEXT2CMD,
+        "latexdiff": "latexdiff",
+    }
+)
 
 
 @attrs.define
@@ -356,22 +456,18 @@ class LatexDiff(Command):
             raise ValueError(f"Expected no arguments, got {arg}")
 
         # Create builds
-        variables = {
-            "latexdiff_context2cmd": DEFAULT_CONTEXT2CMD,
-            "latexdiff": "latexdiff",
-        }
         builds = [
             {
                 "outputs": [f"{diff_prefix}.bbl"],
                 "rule": "latex_diff",
                 "inputs": [f"{old_prefix}.bbl", f"{new_prefix}.bbl"],
-                "variables": variables,
+                "variables": LATEX_DIFF_VARIABLES,
             },
             {
                 "outputs": [f"{diff_prefix}.tex"],
                 "rule": "latex_diff",
                 "inputs": [f"{old_prefix}.tex", f"{new_prefix}.tex"],
-                "variables": variables,
+                "variables": LATEX_DIFF_VARIABLES,
             },
         ]
         return builds, []
@@ -44,8 +44,9 @@ class PDFMerge(Command):
         # Check parameters
         if len(inp) == 0:
             raise ValueError(f"Expecting at least one input PDF, got: {inp}")
-        if not all(path_pdf.endswith(".pdf") for path_pdf in inp):
-            raise ValueError(f"The input files must end with .pdf, got {inp}.")
+        for path_pdf in inp:
+            if not path_pdf.endswith(".pdf"):
+                raise ValueError(f"The input files must end with .pdf, got {path_pdf}.")
         if len(out) != 1:
             raise ValueError(f"Expecting one output, the merged PDF file, got: {out}")
         path_out = out[0]
@@ -77,9 +78,7 @@ class PDFAddNotes(Command):
     def rules(self) -> dict[str, dict]:
         """A dict of kwargs for Ninja's ``Writer.rule()``."""
         return {
-            "pdf_add_notes": {
-                "command": "rr-pdf-add-notes ${in} ${out} && rr-pdf-normalize ${out}"
-            },
+            "pdf_add_notes": {"command": "rr-pdf-add-notes ${in} ${out}"},
         }
 
     def generate(self, inp: list[str], out: list[str], arg) -> tuple[list, list[str]]:
@@ -87,8 +86,9 @@ class PDFAddNotes(Command):
         # Check parameters
         if len(inp) != 2:
             raise ValueError(f"Expecting two input PDFs, got: {inp}")
-        if not all(path_pdf.endswith(".pdf") for path_pdf in inp):
-            raise ValueError(f"The input files must end with .pdf, got {inp}.")
+        for path_pdf in inp:
+            if not path_pdf.endswith(".pdf"):
+                raise ValueError(f"The input files must end with .pdf, got {path_pdf}.")
         if len(out) != 1:
             raise ValueError(f"Expecting one output PDF file, got: {out}")
         path_out = out[0]
@@ -120,8 +120,7 @@ class PDFNup(Command):
         """A dict of kwargs for Ninja's ``Writer.rule()``."""
         return {
             "pdf_nup": {
-                "command": "rr-pdf-nup ${in} ${nrow} ${ncol} "
-                "${margin} ${width} ${height} ${out} && rr-pdf-normalize ${out}"
+                "command": "rr-pdf-nup ${in} ${nrow} ${ncol} ${margin} ${width} ${height} ${out}"
             },
         }
 
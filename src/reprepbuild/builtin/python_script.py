@@ -26,7 +26,13 @@ import os
 import attrs
 
 from ..command import Command
-from ..utils import format_case_args, hide_path, import_python_path, load_constants
+from ..utils import (
+    format_case_args,
+    hide_path,
+    import_python_path,
+    join_normalized,
+    load_constants,
+)
 
 __all__ = ("python_script",)
 
@@ -81,7 +87,8 @@ class PythonScript(Command):
         constants = load_constants(root, workdir, paths_constants)
         constants["here"] = workdir
 
-        with contextlib.chdir(workdir):
+        # Scripts in the current directory do not need a change of directory.
+        with contextlib.nullcontext() if workdir == "." else contextlib.chdir(workdir):
             # Load the script in its own directory
             script = import_python_path(fn_py)
 
@@ -102,7 +109,7 @@ class PythonScript(Command):
             case_fmt = getattr(script, "REPREPBUILD_CASE_FMT", None)
 
             def fix_path(fn_local):
-                return os.path.normpath(os.path.join(workdir, fn_local))
+                return join_normalized(workdir, fn_local)
 
             def get_paths(build_info, name):
                 """Extract a list of paths, type check and fix."""
@@ -115,9 +122,11 @@ class PythonScript(Command):
             builds = []
             paths_log = []
             info_kwargs = {}
+            # The signature is inspected only once, not for every case.
+            info_wants_constants = "constants" in inspect.signature(reprepbuild_info).parameters
             for script_args in build_cases:
                 # Re-assign constants to avoid passing on changes.
-                if "constants" in inspect.signature(reprepbuild_info).parameters:
+                if info_wants_constants:
                     info_kwargs = {"constants": constants.copy()}
                 build_info = reprepbuild_info(*script_args, **info_kwargs)
                 if build_info is None:
@@ -24,6 +24,7 @@ import os
 import attrs
 
 from ..command import Command
+from ..utils import join_normalized
 
 __all__ = ("shell_script",)
 
@@ -58,10 +59,11 @@ class ShellScript(Command):
             raise ValueError(f"Python script does not exist: {path_sh}")
 
         workdir, fn_sh = os.path.split(path_sh)
+        workdir = os.path.normpath(workdir)
         script_prefix = fn_sh[:-3]
 
         def fix_path(fn_local):
-            return os.path.normpath(os.path.join(workdir, fn_local))
+            return join_normalized(workdir, fn_local)
 
         # Deduce implicit inputs and outputs
         implicit = []
@@ -19,7 +19,7 @@
 import os
 import re
 from collections.abc import Callable
-from mmap import mmap
+from mmap import ACCESS_READ, mmap
 
 import attrs
 
@@ -141,9 +141,8 @@ def _generate_implicit_svg(src: str, _arg) -> tuple[list[str], list[str]]:
         path_svg = gendeps[idep]
         # It is generally a poor practice to parse XML with a regular expression,
         # unless performance becomes an issue...
-        with open(path_svg, "r+") as fh:
-            data = mmap(fh.fileno(), 0)
-            hrefs = re.findall(RE_SVG_HREF, data)
+        with open(path_svg, "rb") as fh, mmap(fh.fileno(), 0, access=ACCESS_READ) as data:
+            hrefs = RE_SVG_HREF.findall(data)
 
         # Process hrefs
         for href in hrefs:
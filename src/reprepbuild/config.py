@@ -35,6 +35,9 @@ from .utils import load_constants
 __all__ = ("load_config", "rewrite_path")
 
 
+# Use the faster LibYAML-based loader when available.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 RE_IMPORT = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*")
 RE_NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
 
@@ -160,6 +163,7 @@ def load_config(
     paths_constants: list[str],
     generators: list[BaseGenerator],
     phony_deps: set[str] | None = None,
+    paths_config: list[str] | None = None,
 ):
     """Load a RepRepBuild configuration file (recursively).
 
@@ -175,15 +179,20 @@ def load_config(
         List of files with constants.
     phony_deps
         Phony dependencies imposed by previous barrier commands.
+    paths_config
+        If given, the paths of all loaded configuration files, relative to root,
+        are appended to this list. (output parameter)
     """
     workdir, fn_config = os.path.split(path_config)
+    if paths_config is not None:
+        paths_config.append(os.path.relpath(path_config, root))
     constants = load_constants(root, workdir, paths_constants)
 
     # Load config file into Config instance with basic validation.
     converter = cattrs.Converter(forbid_extra_keys=True)
     with open(path_config) as fh:
         try:
-            config = converter.structure(yaml.safe_load(fh), Config)
+            config = converter.structure(yaml.load(fh, Loader=YAML_LOADER), Config)
         except Exception as exc:
             exc.add_note(f"Error occurred while loading {path_config}")
             raise
@@ -209,6 +218,7 @@ def load_config(
                 paths_constants,
                 generators,
                 phony_deps,
+                paths_config,
             )
         elif isinstance(task_config, BuildConfig):
             command = commands.get(task_config.command)
@@ -265,16 +275,17 @@ def rewrite_path(path: str, constants: dict[str, str], ignore_wild: bool = False
     rewritten
         The rewritten path
     """
-    if ignore_wild:
-        path_template = NoNamedTemplate(path)
-    else:
+    if "$" in path:
         path_template = NoNamedTemplate(path)
-    if not path_template.is_valid():
-        raise ValueError(f"Invalid path template string: {path}")
-    if ignore_wild:
-        result = path_template.substitute_nonamed(constants)
+        if not path_template.is_valid():
+            raise ValueError(f"Invalid path template string: {path}")
+        if ignore_wild:
+            result = path_template.substitute_nonamed(constants)
+        else:
+            result = path_template.substitute(constants)
     else:
-        result = path_template.substitute(constants)
+        # Without placeholders, there is nothing to substitute.
+        result = path
     if result.startswith(os.sep):
         result = os.path.normpath(os.path.relpath(result, constants["root"]))
     else:
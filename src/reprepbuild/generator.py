@@ -22,6 +22,7 @@
 import functools
 import operator
 import os
+import sys
 from collections.abc import Iterator
 
 import attrs
@@ -246,15 +247,18 @@ def _expand_constants(build: dict, constants: dict[str, str]):
     """Expand constants and normalize paths in build record."""
 
     def _expand(path):
-        path_template = CaseSensitiveTemplate(path)
-        if not path_template.is_valid():
-            raise ValueError(f"Invalid subsequent inp template string: {path}")
-        path = path_template.substitute(constants)
+        # Most paths contain no placeholders, in which case the template can be skipped.
+        if "$" in path:
+            path_template = CaseSensitiveTemplate(path)
+            if not path_template.is_valid():
+                raise ValueError(f"Invalid subsequent inp template string: {path}")
+            path = path_template.substitute(constants)
         # TODO: Improve detection of path, or implement it differently.
         #       The current test may have false positives.
         if path.startswith(os.sep):
             path = os.path.normpath(os.path.relpath(path, constants["root"]))
-        return path
+        # The same paths reappear in many build records, e.g. as output and later as input.
+        return sys.intern(path)
 
     variables = build.get("variables")
     if variables is not None:
@@ -303,13 +307,13 @@ def _clean_build(build: dict):
         Dictionary with keyword arguments for Writer.build.
         This argument is modified in-place.
     """
-    # Remove duplicates
-    for key in "implicit", "order_only", "implicit_outputs":
-        values = build.get(key)
-        if values is not None:
-            build[key] = sorted(set(values))
-    # Remove empty lists and dicts
     for key in "inputs", "outputs", "implicit", "order_only", "implicit_outputs", "variables":
         values = build.get(key)
-        if values is not None and len(values) == 0:
+        if values is None:
+            continue
+        if len(values) == 0:
+            # Remove empty lists and dicts
             del build[key]
+        elif key in ("implicit", "order_only", "implicit_outputs"):
+            # Remove duplicates
+            build[key] = sorted(set(values))
@@ -25,6 +25,7 @@ Named wildcards have the following semantics:
   in a string, they only match when their matches are identical.
 - All anonymous wildcards from glob are also supported.
 """
+import functools
 import re
 import string
 from collections.abc import Collection, Iterator
@@ -216,15 +217,21 @@ def filter_named(
     if len(patterns) != len(candidates):
         raise ValueError("The parameters patterns and candidates must have the same length.")
 
-    local_candidates = sorted({*candidates[0], *global_candidates})
-    for local_mapping, local_matches in filter_named_single(patterns[0], local_candidates):
+    # Merge the candidates with the global ones only once, instead of in every recursion.
+    all_candidates = [sorted({*local, *global_candidates}) for local in candidates]
+    yield from _filter_named(patterns, all_candidates)
+
+
+def _filter_named(
+    patterns: list[str], all_candidates: list[list[str]]
+) -> Iterator[tuple[dict[str, str], list[list[str]]]]:
+    """Recursive part of ``filter_named``, with candidates already merged."""
+    for local_mapping, local_matches in filter_named_single(patterns[0], all_candidates[0]):
         if len(patterns) > 1:
             other_patterns = [
                 NoNamedTemplate(pattern).safe_substitute(local_mapping) for pattern in patterns[1:]
             ]
-            for other_mapping, other_matches in filter_named(
-                other_patterns, candidates[1:], global_candidates
-            ):
+            for other_mapping, other_matches in _filter_named(other_patterns, all_candidates[1:]):
                 yield local_mapping | other_mapping, [local_matches, *other_matches]
         else:
             yield local_mapping, [local_matches]
@@ -296,10 +303,12 @@ def filter_named_single(
 
     The lists of filenames (values of the dictionary) are sorted alphabetically.
     """
-    regex = re.compile(convert_named_to_regex(pattern))
+    regex, prefix, suffix = _compile_named(pattern)
     keys = None
     matches = {}
     for path in paths:
+        if not (path.startswith(prefix) and path.endswith(suffix)):
+            continue
         match_ = regex.fullmatch(path)
         if match_ is not None:
             if keys is None:
@@ -317,3 +326,19 @@ def filter_named_single(
         keys = [f"*{key}" for key in keys]
         for values, filenames in sorted(matches.items()):
             yield dict(zip(keys, values, strict=False)), sorted(filenames)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_named(pattern: str) -> tuple[re.Pattern, str, str]:
+    """Compile a named glob pattern and extract its literal prefix and suffix.
+
+    The same patterns are filtered many times, e.g. for all combinations of named wildcards
+    in ``filter_named``, so the result is cached.
+
+    Paths not starting with the literal part of the pattern (before the first wildcard)
+    or not ending with the literal part after the last wildcard can be skipped
+    without invoking the regular expression, e.g. all outputs in other directories
+    or with other extensions.
+    """
+    parts = RE_NAMED_WILD.split(pattern)
+    return re.compile(convert_named_to_regex(pattern)), parts[0], parts[-1]
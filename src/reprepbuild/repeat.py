@@ -23,12 +23,11 @@ import os
 import subprocess
 import time
 import traceback
-from glob import glob
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
-from .__main__ import generate, parse_args, sanity_check
+from .__main__ import NINJA_STATUS, generate, parse_args
 
 
 class AnyChangeHandler(FileSystemEventHandler):
@@ -73,13 +72,15 @@ class AnyChangeHandler(FileSystemEventHandler):
 
 def main():
     """Main program."""
-    sanity_check()
     args = parse_args()
+    os.environ["NINJA_STATUS"] = NINJA_STATUS
     observer = Observer()
     event_handler = AnyChangeHandler()
     observer.schedule(event_handler, ".")
-    for path in glob("*/"):
-        observer.schedule(event_handler, path)
+    with os.scandir(".") as it:
+        for entry in it:
+            if entry.is_dir() and not entry.name.startswith("."):
+                observer.schedule(event_handler, entry.path)
     observer.start()
     try:
         while True:
@@ -88,12 +89,8 @@ def main():
                 continue
             event_handler.snooze()
             try:
-                generate(os.getcwd())
-                subprocess.run(
-                    ["ninja", *args],
-                    check=False,
-                    env=os.environ | {"NINJA_STATUS": "\033[1;36;40m[%f/%t]\033[0;0m "},
-                )
+                generate()
+                subprocess.run(["ninja", *args], check=False)
             except Exception:
                 print(traceback.format_exc())
             time.sleep(0.1)
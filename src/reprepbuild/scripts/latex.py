@@ -20,6 +20,7 @@
 r"""Print the error message from a LaTeX log file."""
 
 import argparse
+import contextlib
 import os
 import re
 import subprocess
@@ -79,7 +80,9 @@ def main() -> int:
     if not fn_tex.endswith(".tex"):
         raise ValueError("The LaTeX source must have extension .tex")
     stem = fn_tex[:-4]
-    path_aux = os.path.join(workdir, f"{stem}.aux")
+    path_stem = os.path.join(workdir, stem)
+    path_aux = path_stem + ".aux"
+    path_log = path_stem + ".log"
 
     # Remove existing outputs from a previous run, which could potentially
     # conflict with the new tex source files. In 99% of the cases, this is
@@ -88,9 +91,12 @@ def main() -> int:
     if args.bibtex is not None:
         exts_to_remove.append("bbl")
     for ext in exts_to_remove:
-        path_to_remove = os.path.join(workdir, f"{stem}.{ext}")
-        if os.path.isfile(path_to_remove):
-            os.remove(path_to_remove)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(f"{path_stem}.{ext}")
+
+    # The same environment is used for all subprocesses.
+    env = os.environ.copy()
+    env["SOURCE_DATE_EPOCH"] = "315532800"
 
     aux_sha256_hist = []
     if args.bibtex is not None:
@@ -102,10 +108,9 @@ def main() -> int:
             stderr=subprocess.DEVNULL,
             check=False,
             cwd=workdir,
-            env=os.environ | {"SOURCE_DATE_EPOCH": "315532800"},
+            env=env,
         )
         if cp.returncode != 0:
-            path_log = os.path.join(workdir, f"{stem}.log")
             error_info = parse_latex_log(path_log)
             error_info.print(path_log)
             return 1
@@ -120,10 +125,10 @@ def main() -> int:
             stderr=subprocess.DEVNULL,
             check=False,
             cwd=workdir,
-            env=os.environ | {"SOURCE_DATE_EPOCH": "315532800"},
+            env=env,
         )
         if cp.returncode != 0:
-            path_blg = os.path.join(workdir, f"{stem}.blg")
+            path_blg = path_stem + ".blg"
             error_info = parse_bibtex_log(path_blg)
             error_info.print(path_blg)
             return 2
@@ -155,9 +160,8 @@ def main() -> int:
             stderr=subprocess.DEVNULL,
             check=False,
             cwd=workdir,
-            env=os.environ | {"SOURCE_DATE_EPOCH": "315532800"},
+            env=env,
         )
-        path_log = os.path.join(workdir, f"{stem}.log")
         error_info = parse_latex_log(path_log)
         if cp.returncode != 0:
             error_info.print(path_log)
@@ -172,6 +176,10 @@ def main() -> int:
     return -3
 
 
+RE_BRACKET = re.compile(r"\((?:(?:\./|\.\./|/)[-_./a-zA-Z0-9]+)?|\)")
+LOG_FILENAME_ENDINGS = (".tex\n", ".sty\n", ".cls\n", ".def\n", ".cfg\n", ".clo\n")
+
+
 @attrs.define
 class LatexSourceStack:
     stack: list[str] = attrs.field(init=False, default=attrs.Factory(list))
@@ -192,10 +200,7 @@ class LatexSourceStack:
         if full:
             # Some exceptions: guess when 80-char lines end exactly with a filename.
             # This is fragile, but LaTeX log files are just a mess to parse.
-            for end in ".tex\n", ".sty\n", ".cls\n", ".def\n", ".cfg\n", ".clo\n":
-                if line.endswith(end):
-                    full = False
-                    break
+            full = not line.endswith(LOG_FILENAME_ENDINGS)
 
         # Continue from previous line if needed
         if self.unfinished is not None:
@@ -207,7 +212,7 @@ class LatexSourceStack:
             return
 
         # Update to stack
-        brackets = re.findall(r"\((?:(?:\./|\.\./|/)[-_./a-zA-Z0-9]+)?|\)", line)
+        brackets = RE_BRACKET.findall(line)
         for bracket in brackets:
             if bracket == ")":
                 if len(self.stack) == 0:
@@ -29,8 +29,12 @@ There are two kinds of MANIFEST files:
 
 
 import argparse
+import contextlib
 import hashlib
+import os
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 from setuptools.command.egg_info import FileList
 from tqdm import tqdm
@@ -54,8 +58,10 @@ def main() -> int:
 
     # Build the full file list with file sizes and SHA256 sums.
     with open(args.manifest_in[:-3] + ".sha256", "w") as f:
-        for fn in tqdm(filelist.files, delay=1):
-            size, sha256 = compute_sha256(fn)
+        results = compute_sha256_many(filelist.files)
+        for fn, (size, sha256) in zip(
+            filelist.files, tqdm(results, total=len(filelist.files), delay=1), strict=True
+        ):
             f.write(f"{size:15d} {sha256} {fn}\n")
     return 0
 
@@ -70,19 +76,56 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-def compute_sha256(path: str) -> tuple[int, str]:
-    """Compute SHA256 hash and size in bytes of a file."""
+def compute_sha256(path: str, path_copy: str | None = None) -> tuple[int, str]:
+    """Compute SHA256 hash and size in bytes of a file.
+
+    When path_copy is given, the file is also copied to this location
+    while reading it, such that the file is read only once.
+    """
     size = 0
     sha = hashlib.sha256()
-    with open(path, "rb") as f:
+    with open(path, "rb") as f, contextlib.ExitStack() as stack:
+        fcopy = None if path_copy is None else stack.enter_context(open(path_copy, "wb"))
         while True:
             block = f.read(1048576)
             size += len(block)
             if len(block) == 0:
                 break
             sha.update(block)
+            if fcopy is not None:
+                fcopy.write(block)
     return size, sha.hexdigest()
 
 
+def compute_sha256_many(paths: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Compute SHA256 hashes and sizes of multiple files, in the same order as the paths.
+
+    The files are read and hashed in a thread pool,
+    which is effective because hashlib releases the GIL while hashing large blocks.
+    """
+    with ThreadPoolExecutor() as executor:
+        yield from executor.map(compute_sha256, paths)
+
+
+def write_manifest(path_manifest: str, paths: list[str], workdir: str = ""):
+    """Write a MANIFEST.sha256 file for the given paths.
+
+    Parameters
+    ----------
+    path_manifest
+        The MANIFEST.sha256 file to write.
+    paths
+        The files to include, which must all be inside workdir.
+    workdir
+        The directory relative to which paths are written in the manifest file.
+    """
+    offset = len(os.path.join(workdir, ""))
+    with open(path_manifest, "w") as f:
+        f.writelines(
+            f"{size:15d} {sha256} {path[offset:]}\n"
+            for path, (size, sha256) in zip(paths, compute_sha256_many(paths), strict=True)
+        )
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -91,6 +91,9 @@ HTML_HEADER = """\
 HTML_FOOTER = "</body>"
 
 
+RE_EQUATION = re.compile(r"\B\$(\S|\S[^\n\r]*?\S)\$\B")
+
+
 MACRO_TEXT = r"""\
 \bvec:\vec{\mathbf{#1}}
 \normvec:\hat{\mathbf{#1}}
@@ -118,7 +121,7 @@ def convert_markdown(text_md, *, fn_html=None, fn_pdf=None):
         raise ValueError("No HTML or PDF output provided.")
 
     # Convert conventional LaTeX equation syntax to make it compatible with markdown_katex
-    text_md = re.sub(r"\B\$(\S|\S[^\n\r]*?\S)\$\B", r"$`\1`$", text_md)
+    text_md = RE_EQUATION.sub(r"$`\1`$", text_md)
 
     # Write macros to temporary file for KaTeX.
     with tempfile.NamedTemporaryFile(suffix=".tex") as f:
@@ -28,7 +28,7 @@ except ImportError:
     import fitz
 
 
-__all__ = ("pdf_normalize",)
+__all__ = ("pdf_normalize", "save_normalized")
 
 
 def main() -> int:
@@ -50,16 +50,25 @@ def pdf_normalize(path_pdf: str):
         print(f"The input must have a `.pdf` extension, got: {path_pdf}")
         return 2
     pdf = fitz.open(path_pdf)
-    pdf.set_metadata({})
-    pdf.del_xml_metadata()
-    pdf.xref_set_key(-1, "ID", "null")
-    pdf.scrub()
     with tempfile.TemporaryDirectory(suffix="normalize-pdf", prefix="rr") as dn:
         path_out = os.path.join(dn, "out.pdf")
-        pdf.save(path_out, garbage=4, deflate=True, linear=True, no_new_id=True)
+        save_normalized(pdf, path_out)
         pdf.close()
         shutil.copy(path_out, path_pdf)
 
 
+def save_normalized(pdf: fitz.Document, path_out: str):
+    """Normalize an open PDF document and save it.
+
+    This has the same result as saving the document and calling ``pdf_normalize`` on the file,
+    without writing and parsing the PDF twice.
+    """
+    pdf.set_metadata({})
+    pdf.del_xml_metadata()
+    pdf.xref_set_key(-1, "ID", "null")
+    pdf.scrub()
+    pdf.save(path_out, garbage=4, deflate=True, linear=True, no_new_id=True)
+
+
 if __name__ == "__main__":
     sys.exit(main())
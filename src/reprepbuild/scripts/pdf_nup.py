@@ -24,6 +24,7 @@ try:
 except ImportError:
     import fitz
 
+from .pdf_normalize import save_normalized
 
 __all__ = ("pdf_nup",)
 
@@ -109,8 +110,7 @@ def pdf_nup(
                 src,
                 ifine,
             )
-    dst.xref_set_key(-1, "ID", "null")
-    dst.save(path_dst, garbage=4, deflate=True)
+    save_normalized(dst, path_dst)
     dst.close()
     src.close()
 
@@ -24,7 +24,7 @@ import os
 import sys
 
 from ..utils import parse_inputs_fls
-from .manifest import compute_sha256
+from .manifest import write_manifest
 from .zip_manifest import make_zip_manifest
 
 
@@ -55,10 +55,7 @@ def make_zip_latex(path_fls: str, path_zip: str) -> int:
     # Make a manifest file
     paths_in = parse_inputs_fls(path_fls)
     path_manifest = os.path.join(workdir, prefix + ".sha256")
-    with open(path_manifest, "w") as f:
-        for path_in in paths_in:
-            size, sha256 = compute_sha256(path_in)
-            f.write(f"{size:15d} {sha256} {path_in[len(workdir) + 1:]}\n")
+    write_manifest(path_manifest, paths_in, workdir)
 
     # Collect files to be zipped and write zip
     return make_zip_manifest(path_manifest, path_zip, check_sha256=False)
@@ -21,6 +21,7 @@
 
 
 import argparse
+import contextlib
 import datetime
 import os
 import shutil
@@ -36,6 +37,9 @@ __all__ = ("make_zip_manifest",)
 
 
 TIMESTAMP = datetime.datetime(1980, 1, 1).timestamp()
+# Files with these extensions are already compressed.
+# Deflating them again is slow and hardly reduces their size, so they are stored as is.
+STORED_EXTENSIONS = (".7z", ".bz2", ".gz", ".jpeg", ".jpg", ".png", ".xz", ".zip", ".zst")
 
 
 def main() -> int:
@@ -129,7 +133,7 @@ def create_zip(
         The exit code of the script.
     """
     # Remove old zip
-    if os.path.isfile(path_zip):
+    with contextlib.suppress(FileNotFoundError):
         os.remove(path_zip)
 
     # Create new one.
@@ -141,12 +145,10 @@ def create_zip(
                 # This saves bandwith in case of remote datasets and allows
                 # fixing the timestamp before compression.
                 dst = os.path.join(tmpdir, "todo")
-                shutil.copyfile(src, dst)
-                os.utime(dst, (TIMESTAMP, TIMESTAMP))
-                # Check if needed
+                # Check if needed, hashing the contents while copying.
                 if check_sha256 and info is not None:
                     size, sha256 = info
-                    mysize, mysha256 = compute_sha256(dst)
+                    mysize, mysha256 = compute_sha256(src, dst)
                     if size != mysize:
                         print(f"Size mismatch for file: got {mysize}, expected {size}, for {src}")
                         return 2
@@ -156,8 +158,15 @@ def create_zip(
                             f"got {mysha256}, expected {sha256}, for {src}"
                         )
                         return 2
+                else:
+                    shutil.copyfile(src, dst)
+                os.utime(dst, (TIMESTAMP, TIMESTAMP))
                 # Compress
-                fz.write(dst, src[nskip:], zipfile.ZIP_DEFLATED)
+                if src.lower().endswith(STORED_EXTENSIONS):
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                fz.write(dst, src[nskip:], compress_type)
     return 0
 
 
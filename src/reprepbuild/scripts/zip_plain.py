@@ -23,7 +23,7 @@ import argparse
 import os
 import sys
 
-from .manifest import compute_sha256
+from .manifest import write_manifest
 from .zip_manifest import make_zip_manifest
 
 
@@ -46,11 +46,7 @@ def make_zip_plain(paths_in: str, path_zip: str) -> int:
     if not path_zip.endswith(".zip"):
         raise ValueError("The ZIP file must end with extension .zip.")
     path_manifest = get_path_manifest(paths_in, path_zip)
-    workdir = os.path.dirname(path_manifest)
-    with open(path_manifest, "w") as f:
-        for path_in in paths_in:
-            size, sha256 = compute_sha256(path_in)
-            f.write(f"{size:15d} {sha256} {path_in[len(workdir) + 1:]}\n")
+    write_manifest(path_manifest, paths_in, os.path.dirname(path_manifest))
 
     # Collect files to be zipped and write zip
     return make_zip_manifest(path_manifest, path_zip, check_sha256=False)
@@ -49,6 +49,7 @@ from parse import parse
 __all__ = (
     "parse_inputs_fls",
     "hide_path",
+    "join_normalized",
     "write_dep",
     "write_dyndep",
     "import_python_path",
@@ -72,31 +73,29 @@ def parse_inputs_fls(path_fls: str) -> list[str]:
     paths
         A list of paths.
     """
-    # Collect inputs and outputs
+    # Collect inputs and outputs.
+    # LaTeX reads many files more than once, so duplicates are removed before normalization.
     workdir = os.path.dirname(path_fls)
-    inputs = set()
-    outputs = set()
     with open(path_fls) as f:
-        for line in f:
-            if line.startswith("INPUT "):
-                select = inputs
-                my_path = line[6:].strip()
-            elif line.startswith("OUTPUT "):
-                select = outputs
-                my_path = line[7:].strip()
-            else:
-                continue
-            my_path = os.path.normpath(my_path)
-            if my_path.startswith("/"):
-                continue
-            my_path = os.path.join(workdir, my_path)
-            select.add(my_path)
+        lines = f.read().splitlines()
+    inputs = {line[6:].strip() for line in lines if line.startswith("INPUT ")}
+    outputs = {line[7:].strip() for line in lines if line.startswith("OUTPUT ")}
     # When files are both inputs and outputs, skip them.
     # These are usually aux and out.
-    inputs -= outputs
+    inputs = _local_fls_paths(inputs, workdir) - _local_fls_paths(outputs, workdir)
     return sorted(inputs)
 
 
+def _local_fls_paths(paths: Collection[str], workdir: str) -> set[str]:
+    """Normalize relative paths from an fls file, skip absolute ones and prepend the workdir."""
+    result = set()
+    for path in paths:
+        path = os.path.normpath(path)
+        if not path.startswith("/"):
+            result.add(os.path.join(workdir, path))
+    return result
+
+
 def hide_path(visible_path: str) -> str:
     parent, name = os.path.split(visible_path)
     if not name.startswith("."):
@@ -104,6 +103,18 @@ def hide_path(visible_path: str) -> str:
     return os.path.join(parent, name)
 
 
+def join_normalized(root: str, path: str) -> str:
+    """Join a normalized root directory and a path, with the same result as normpath(join(...)).
+
+    Most paths contain no empty, ``.`` or ``..`` components,
+    in which case they are joined without calling ``os.path.normpath``.
+    """
+    padded = f"/{path}/"
+    if "//" in padded or "/./" in padded or "/../" in padded:
+        return os.path.normpath(os.path.join(root, path))
+    return path if root == "." else os.path.join(root, path)
+
+
 def _filter_local_files(all_paths: Collection[str]) -> list[str]:
     """Return only those paths under the cwd, without duplicates, sorted and normalized."""
     local = set()
@@ -159,15 +170,20 @@ def write_dyndep(path_dyndep: str, output: str, imp_outputs: list[str], imp_inpu
 
 
 def import_python_path(path):
-    """Return a module by importing a Python file at a given path."""
-    cwd = os.getcwd()
-    sys.path.append(cwd)
+    """Return a module by importing a Python file at a given path.
+
+    The directory containing the Python file is temporarily added to ``sys.path``,
+    such that local modules next to the script can be imported,
+    irrespective of the current working directory.
+    """
+    workdir = os.path.dirname(os.path.abspath(path))
+    sys.path.append(workdir)
     spec = importlib.util.spec_from_file_location("<pythonscript>", path)
     module = importlib.util.module_from_spec(spec)
     try:
         spec.loader.exec_module(module)
     finally:
-        sys.path.remove(cwd)
+        sys.path.remove(workdir)
     return module
 
 
@@ -316,8 +332,7 @@ def load_constants(root: str, cwd: str, paths_constants) -> dict[str:str]:
         path_json = path_json.strip()
         if path_json == "":
             continue
-        with open(path_json) as fh:
-            this_result = json.load(fh)
+        this_result = _load_json(path_json)
         if not isinstance(this_result, dict):
             raise TypeError(f"The file {path_json} does not contain a dictionary.")
         for name, value in this_result.items():
@@ -331,3 +346,24 @@ def load_constants(root: str, cwd: str, paths_constants) -> dict[str:str]:
             constants[name] = value_template.substitute(constants)
 
     return constants
+
+
+# Contents of JSON files loaded in previous calls to _load_json. Keys are absolute paths.
+# Values are tuples of the modification time, the file size and the parsed contents.
+_LOADED_JSON = {}
+
+
+def _load_json(path_json: str):
+    """Load a JSON file, or reuse a previous result when the file did not change.
+
+    The result is shared between calls and must not be modified.
+    """
+    path_abs = os.path.abspath(path_json)
+    stat = os.stat(path_abs)
+    cached = _LOADED_JSON.get(path_abs)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path_abs) as fh:
+        result = json.load(fh)
+    _LOADED_JSON[path_abs] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
@@ -117,6 +117,26 @@ def test_config_example(tmpdir: str):
     )
 
 
+def test_config_example_paths_config(tmpdir: str):
+    tmpdir = str(tmpdir)
+    for filename, contents in CREATE_FILES.items():
+        path_dst = os.path.join(tmpdir, filename)
+        os.makedirs(os.path.dirname(path_dst), exist_ok=True)
+        with open(path_dst, "w") as fh:
+            fh.write(contents)
+    tasks = []
+    paths_config = []
+    with contextlib.chdir(tmpdir):
+        load_config(
+            tmpdir,
+            os.path.join(tmpdir, "reprepbuild.yaml"),
+            ["constants.json"],
+            tasks,
+            paths_config=paths_config,
+        )
+    assert paths_config == ["reprepbuild.yaml", "sub1/reprepbuild.yaml", "sub2/reprepbuild.yaml"]
+
+
 def test_iterate_loop_config():
     loop1 = LoopConfig("food", "egg spam")
     assert loop1.key == ["food"]
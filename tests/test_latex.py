@@ -840,6 +840,51 @@ def test_scan_latex_deps(tmpdir):
     assert set(bib) == bib_ref
 
 
+def test_scan_latex_deps_changed(tmpdir):
+    path_main_tex = os.path.join(tmpdir, "main.tex")
+    with open(path_main_tex, "w") as fh:
+        fh.write("\\input{foo}\n")
+    implicit, _, _ = scan_latex_deps(path_main_tex)
+    assert implicit == [os.path.join(tmpdir, "foo.tex")]
+    with open(path_main_tex, "w") as fh:
+        fh.write("\\input{foobar}\n")
+    # Make sure the modification time changes, also on file systems with a coarse resolution.
+    st = os.stat(path_main_tex)
+    os.utime(path_main_tex, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    implicit, _, _ = scan_latex_deps(path_main_tex)
+    assert implicit == [os.path.join(tmpdir, "foobar.tex")]
+
+
+def test_scan_latex_deps_circular(tmpdir):
+    path_main_tex = os.path.join(tmpdir, "main.tex")
+    with open(path_main_tex, "w") as fh:
+        fh.write("\\input{foo}\n\\input{bar}\n")
+    with open(os.path.join(tmpdir, "foo.tex"), "w") as fh:
+        fh.write("\\input{main}\n\\input{bar}\n")
+    with open(os.path.join(tmpdir, "bar.tex"), "w") as fh:
+        fh.write("\\includegraphics{fig}\n")
+    implicit, gendeps, bib = scan_latex_deps(path_main_tex)
+    names = ["bar.tex", "fig.pdf", "foo.tex", "main.tex"]
+    assert implicit == [os.path.join(tmpdir, name) for name in names]
+    assert gendeps == [os.path.join(tmpdir, name) for name in names if name.endswith(".tex")]
+    assert bib == []
+
+
+def test_scan_latex_deps_comments(tmpdir):
+    path_main_tex = os.path.join(tmpdir, "main.tex")
+    with open(path_main_tex, "w") as fh:
+        fh.write(
+            "50\\% of \\input{foo} % \\input{bar}\n"
+            "\\input{generated} %REPREPBUILD ignore\n"
+            "%REPREPBUILD input data.csv\n"
+            "line break \\\\% \\input{missing}\n"
+            "\\input{last}"
+        )
+    implicit, _, _ = scan_latex_deps(path_main_tex)
+    names = ["data.csv", "foo.tex", "last.tex"]
+    assert implicit == [os.path.join(tmpdir, name) for name in names]
+
+
 LATEX_LOG10 = r"""
 This is XeTeX, Version 3.141592653-2.6-0.999995 (TeX Live 2023)
 (preloaded format=xelatex 2023.12.26)  14 JAN 2024 10:12
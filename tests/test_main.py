@@ -0,0 +1,52 @@
+# RepRepBuild is the build tool for Reproducible Reporting.
+# Copyright (C) 2024 Toon Verstraelen
+#
+# This file is part of RepRepBuild.
+#
+# RepRepBuild is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# RepRepBuild is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+# --
+"""Unit tests for reprepbuild.__main__"""
+
+import contextlib
+import os
+
+from reprepbuild.__main__ import generate
+
+CREATE_FILES = {
+    "reprepbuild.yaml": "imports:\n- reprepbuild.builtin\ntasks:\n- subdir: sub\n",
+    "sub/reprepbuild.yaml": (
+        "imports:\n- reprepbuild.builtin\ntasks:\n- command: copy\n  inp: egg\n  out: spam\n"
+    ),
+    "sub/egg": "",
+}
+
+
+def test_generate_gendeps_config(tmpdir, monkeypatch):
+    monkeypatch.delenv("REPREPBUILD_ROOT", raising=False)
+    monkeypatch.delenv("REPREPBUILD_CONSTANTS", raising=False)
+    tmpdir = str(tmpdir)
+    for filename, contents in CREATE_FILES.items():
+        path_dst = os.path.join(tmpdir, filename)
+        os.makedirs(os.path.dirname(path_dst), exist_ok=True)
+        with open(path_dst, "w") as fh:
+            fh.write(contents)
+    with contextlib.chdir(tmpdir):
+        generate()
+        with open("build.ninja") as fh:
+            lines = fh.read().splitlines()
+    generator_lines = [line for line in lines if line.startswith("build build.ninja:")]
+    assert generator_lines == [
+        "build build.ninja: generator | reprepbuild.yaml sub/reprepbuild.yaml"
+    ]
@@ -0,0 +1,70 @@
+# RepRepBuild is the build tool for Reproducible Reporting.
+# Copyright (C) 2024 Toon Verstraelen
+#
+# This file is part of RepRepBuild.
+#
+# RepRepBuild is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# RepRepBuild is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+# --
+"""Unit tests for reprepbuild.scripts.manifest"""
+
+import contextlib
+import hashlib
+import os
+
+import pytest
+from reprepbuild.scripts.manifest import compute_sha256, compute_sha256_many, write_manifest
+
+
+@pytest.mark.parametrize("workdir", ["", "sub", "sub/"])
+def test_write_manifest(tmpdir, workdir):
+    with contextlib.chdir(tmpdir):
+        os.mkdir("sub")
+        paths = [os.path.join(workdir, "a.txt"), os.path.join(workdir, "b.txt")]
+        for path, data in zip(paths, [b"foo", b"barbar"], strict=True):
+            with open(path, "wb") as fh:
+                fh.write(data)
+        write_manifest("MANIFEST.sha256", paths, workdir)
+        with open("MANIFEST.sha256") as fh:
+            lines = fh.readlines()
+    assert lines == [
+        f"{3:15d} {hashlib.sha256(b'foo').hexdigest()} a.txt\n",
+        f"{6:15d} {hashlib.sha256(b'barbar').hexdigest()} b.txt\n",
+    ]
+
+
+def test_compute_sha256_copy(tmpdir):
+    data = bytes(range(256)) * 5000
+    path = os.path.join(tmpdir, "data.bin")
+    with open(path, "wb") as fh:
+        fh.write(data)
+    path_copy = os.path.join(tmpdir, "copy.bin")
+    expected = (len(data), hashlib.sha256(data).hexdigest())
+    assert compute_sha256(path) == expected
+    assert compute_sha256(path, path_copy) == expected
+    with open(path_copy, "rb") as fh:
+        assert fh.read() == data
+
+
+def test_compute_sha256_many_order(tmpdir):
+    contents = [b"x" * size for size in [3000000, 0, 1, 1048576, 5]]
+    paths = []
+    for i, data in enumerate(contents):
+        path = os.path.join(tmpdir, f"file{i}.bin")
+        with open(path, "wb") as fh:
+            fh.write(data)
+        paths.append(path)
+    assert list(compute_sha256_many(paths)) == [
+        (len(data), hashlib.sha256(data).hexdigest()) for data in contents
+    ]
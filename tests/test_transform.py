@@ -109,6 +109,25 @@ def test_write_build_convert_svg_pdf2(tmpdir):
     assert gendeps == ["sub/foo.svg"]
 
 
+SVG_WITH_IMAGE = """\
+<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
+<image width="10" height="10" xlink:href="fig.png" />
+<image width="10" height="10" xlink:href="data:image/png;base64,AAAA" />
+</svg>
+"""
+
+
+def test_write_build_convert_svg_pdf_readonly(tmpdir):
+    with contextlib.chdir(tmpdir):
+        os.mkdir("sub")
+        with open("sub/foo.svg", "w") as fh:
+            fh.write(SVG_WITH_IMAGE)
+        os.chmod("sub/foo.svg", 0o444)
+        builds, gendeps = convert_svg_pdf.generate(["sub/foo.svg"], [], None)
+    assert builds[0]["implicit"] == ["sub/fig.png"]
+    assert gendeps == ["sub/foo.svg"]
+
+
 BUILDS_CONVERT_SVG_PDF3 = [
     {
         "rule": "convert_svg_pdf",
@@ -20,8 +20,17 @@
 """Unit tests for reprepbuild.utils"""
 
 
+import os
+
 import pytest
-from reprepbuild.utils import format_case_args, parse_case_args
+from reprepbuild.utils import (
+    format_case_args,
+    import_python_path,
+    join_normalized,
+    load_constants,
+    parse_case_args,
+    parse_inputs_fls,
+)
 
 
 @pytest.mark.parametrize("prefix", ["boo", "aa_bb", "aa__bb_"])
@@ -122,3 +131,64 @@ def test_parse_case_nofmt(prefix, argstr, args, kwargs):
 def test_parse_case_fmt(argstr, case_fmt, args, kwargs):
     assert parse_case_args(argstr, None, case_fmt) == (args, kwargs)
     assert parse_case_args(argstr, "boo", case_fmt) == (args, kwargs)
+
+
+def test_import_python_path_local_module(tmpdir):
+    tmpdir = str(tmpdir)
+    os.mkdir(os.path.join(tmpdir, "sub"))
+    with open(os.path.join(tmpdir, "sub", "helper.py"), "w") as fh:
+        fh.write("VALUE = 42\n")
+    with open(os.path.join(tmpdir, "sub", "script.py"), "w") as fh:
+        fh.write("from helper import VALUE\n")
+    module = import_python_path(os.path.join(tmpdir, "sub", "script.py"))
+    assert module.VALUE == 42
+
+
+FLS_EXAMPLE = """\
+PWD /home/user/paper
+INPUT /usr/share/texmf/tex/latex/base/article.cls
+INPUT main.tex
+OUTPUT main.log
+INPUT ./main.aux
+OUTPUT main.aux
+INPUT figures/plot.pdf
+INPUT main.tex
+INPUT ./figures/plot.pdf
+OUTPUT main.pdf
+"""
+
+
+def test_parse_inputs_fls(tmpdir):
+    tmpdir = str(tmpdir)
+    path_fls = os.path.join(tmpdir, "paper", "main.fls")
+    os.mkdir(os.path.dirname(path_fls))
+    with open(path_fls, "w") as fh:
+        fh.write(FLS_EXAMPLE)
+    assert parse_inputs_fls(path_fls) == [
+        os.path.join(tmpdir, "paper", "figures", "plot.pdf"),
+        os.path.join(tmpdir, "paper", "main.tex"),
+    ]
+
+
+def test_load_constants_changed(tmpdir):
+    tmpdir = str(tmpdir)
+    path_json = os.path.join(tmpdir, "constants.json")
+    with open(path_json, "w") as fh:
+        fh.write('{"a": "1", "b": "${a}2"}')
+    constants = load_constants(tmpdir, tmpdir, [path_json])
+    assert constants == {"root": tmpdir, "here": ".", "a": "1", "b": "12"}
+    with open(path_json, "w") as fh:
+        fh.write('{"a": "3", "b": "${a}4"}')
+    # Make sure the modification time changes, also on file systems with a coarse resolution.
+    st = os.stat(path_json)
+    os.utime(path_json, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    constants = load_constants(tmpdir, tmpdir, [path_json])
+    assert constants == {"root": tmpdir, "here": ".", "a": "3", "b": "34"}
+
+
+@pytest.mark.parametrize("root", [".", "..", "/", "sub", "../sub", "/abs/sub"])
+@pytest.mark.parametrize(
+    "path", ["", ".", "..", "a", "a/b", "a/", "./a", "a/./b", "a//b", "../a", "a/../b", "/c", "..a"]
+)
+def test_join_normalized(root, path):
+    assert join_normalized(root, path) == os.path.normpath(os.path.join(root, path))
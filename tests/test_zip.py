@@ -17,10 +17,15 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>
 #
 # --
-"""Unit tests for reprepbuild.builtin.zip"""
+"""Unit tests for reprepbuild.builtin.zip and reprepbuild.scripts.zip_manifest"""
 
+import contextlib
+import os
+import zipfile
 
 from reprepbuild.builtin.zip import zip_latex, zip_manifest, zip_plain
+from reprepbuild.scripts.manifest import write_manifest
+from reprepbuild.scripts.zip_manifest import make_zip_manifest
 
 BUILDS_ZIP_MANIFEST = [
     {
@@ -99,3 +104,51 @@ def test_write_build_zip_plain2a():
 def test_write_build_zip_plain2b():
     builds, _ = zip_plain.generate(["foo.txt", "bar.csv"], ["data.zip"], None)
     assert BUILDS_ZIP_PLAIN2 == builds
+
+
+def _write_sub(contents):
+    """Write files in the subdirectory sub and a MANIFEST.sha256 that lists them."""
+    os.mkdir("sub")
+    paths = []
+    for fn, data in contents.items():
+        path = os.path.join("sub", fn)
+        with open(path, "wb") as fh:
+            fh.write(data)
+        paths.append(path)
+    write_manifest("sub/MANIFEST.sha256", paths, "sub")
+
+
+def test_make_zip_manifest_compress_type(tmpdir):
+    with contextlib.chdir(tmpdir):
+        _write_sub({"a.txt": b"text " * 100, "b.png": b"\x89PNG" + bytes(range(256))})
+        assert make_zip_manifest("sub/MANIFEST.sha256", "sub.zip") == 0
+        with zipfile.ZipFile("sub.zip") as fz:
+            compress_types = {zi.filename: zi.compress_type for zi in fz.infolist()}
+    assert compress_types == {
+        "MANIFEST.sha256": zipfile.ZIP_DEFLATED,
+        "a.txt": zipfile.ZIP_DEFLATED,
+        "b.png": zipfile.ZIP_STORED,
+    }
+
+
+def test_make_zip_manifest_contents(tmpdir):
+    contents = {"a.txt": b"text " * 100, "b.png": bytes(range(256)) * 5000}
+    with contextlib.chdir(tmpdir):
+        _write_sub(contents)
+        assert make_zip_manifest("sub/MANIFEST.sha256", "sub.zip") == 0
+        with zipfile.ZipFile("sub.zip") as fz:
+            for fn, data in contents.items():
+                assert fz.read(fn) == data
+
+
+def test_make_zip_manifest_sha256_mismatch(tmpdir):
+    with contextlib.chdir(tmpdir):
+        _write_sub({"a.txt": b"text"})
+        with open("sub/MANIFEST.sha256") as fh:
+            line = fh.read()
+        # Corrupt the first digit of the sha256 hash, which follows the size.
+        tampered = line[:16] + ("1" if line[16] == "0" else "0") + line[17:]
+        with open("sub/MANIFEST.sha256", "w") as fh:
+            fh.write(tampered)
+        assert make_zip_manifest("sub/MANIFEST.sha256", "sub.zip") == 2
+        assert not os.path.exists("sub.zip")